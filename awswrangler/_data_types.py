@@ -441,7 +441,8 @@ def pyarrow_types_from_pandas(
     for col in cols:
         _logger.debug("Inferring PyArrow type from column: %s", col)
         try:
-            schema: pa.Schema = pa.Schema.from_pandas(df=df[[col]], preserve_index=False)
+            # Series.to_frame() reuses the column buffer, while df[[col]] would copy it.
+            schema: pa.Schema = pa.Schema.from_pandas(df=df[col].to_frame(), preserve_index=False)
         except pa.ArrowInvalid as ex:
             cols_dtypes[col] = process_not_inferred_dtype(ex)
         except TypeError as ex:
@@ -1,14 +1,17 @@
 """Internal (private) Utilities Module."""
 
+import atexit
+import collections
 import copy
 import itertools
 import logging
 import math
 import os
 import random
+import threading
 import time
-from concurrent.futures import FIRST_COMPLETED, Future, wait
-from typing import Any, Callable, Dict, Generator, List, Optional, Sequence, Tuple, Union, cast
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Generator, Iterable, List, Optional, Sequence, Tuple, Union, cast
 
 import boto3
 import botocore.config
@@ -72,7 +75,7 @@ def default_botocore_config() -> botocore.config.Config:
     return botocore.config.Config(
         retries=retries_config,
         connect_timeout=10,
-        max_pool_connections=10,
+        max_pool_connections=64,
         user_agent_extra=f"awswrangler/{__version__}",
     )
 
@@ -100,18 +103,36 @@ def _get_endpoint_url(service_name: str) -> Optional[str]:
     return endpoint_url
 
 
+_CLIENT_CACHE_LOCK: threading.Lock = threading.Lock()
+
+
 @apply_configs
 def client(
     service_name: str, session: Optional[boto3.Session] = None, botocore_config: Optional[botocore.config.Config] = None
 ) -> boto3.client:
     """Create a valid boto3.client."""
     endpoint_url: Optional[str] = _get_endpoint_url(service_name=service_name)
-    return ensure_session(session=session).client(
-        service_name=service_name,
-        endpoint_url=endpoint_url,
-        use_ssl=True,
-        config=default_botocore_config() if botocore_config is None else botocore_config,
-    )
+    _session: boto3.Session = ensure_session(session=session)
+    if botocore_config is not None:
+        return _session.client(
+            service_name=service_name, endpoint_url=endpoint_url, use_ssl=True, config=botocore_config
+        )
+    # Client construction re-parses endpoint models and re-resolves credentials (~tens of ms)
+    # and clients are thread-safe once built, so default-config clients are cached per
+    # session/service/endpoint. boto3.Session.client() itself is not thread-safe, hence the lock.
+    cache_key: Tuple[str, Optional[str]] = (service_name, endpoint_url)
+    with _CLIENT_CACHE_LOCK:
+        cache: Dict[Tuple[str, Optional[str]], boto3.client] = _session.__dict__.setdefault(
+            "_awswrangler_client_cache", {}
+        )
+        if cache_key not in cache:
+            cache[cache_key] = _session.client(
+                service_name=service_name,
+                endpoint_url=endpoint_url,
+                use_ssl=True,
+                config=default_botocore_config(),
+            )
+        return cache[cache_key]
 
 
 @apply_configs
@@ -153,8 +174,15 @@ def parse_path(path: str) -> Tuple[str, str]:
     """
     if path.startswith("s3://") is False:
         raise exceptions.InvalidArgumentValue(f"'{path}' is not a valid path. It MUST start with 's3://'")
+    slash_index: int = path.find("/", 5)  # len("s3://") == 5
+    if slash_index < 0:
+        return path[5:], ""
+    bucket: str = path[5:slash_index]
+    if ":" not in bucket:  # Regular bucket name (hot path): parse by index, no temporary list.
+        return bucket, path[slash_index + 1 :]
+    # Access point ARNs and alike fall back to the replace/split based parsing.
     parts = path.replace("s3://", "").replace(":accesspoint/", ":accesspoint:").split("/", 1)
-    bucket: str = parts[0]
+    bucket = parts[0]
     if "/" in bucket:
         raise exceptions.InvalidArgumentValue(f"'{bucket}' is not a valid bucket name.")
     key: str = ""
@@ -202,6 +230,94 @@ def ensure_cpu_count(use_threads: Union[bool, int] = True) -> int:
     return cpus
 
 
+def ensure_worker_count(use_threads: Union[bool, int] = True, num_tasks: Optional[int] = None) -> int:
+    """Get the number of workers to be used on network-bound operations.
+
+    Requests like S3 head_object/delete_objects spend most of their time waiting on
+    round-trips, so os.cpu_count() is a poor upper bound for them. In case of
+    `use_threads=True` the worker count scales with the number of tasks instead,
+    bounded to keep the HTTPS connection usage reasonable.
+
+    Parameters
+    ----------
+    use_threads : Union[bool, int]
+            True to enable multi-core utilization, False to disable.
+            If given an int will simply return the input value.
+    num_tasks : int, optional
+        Number of parallelizable tasks (e.g. number of S3 objects paths).
+
+    Returns
+    -------
+    int
+        Number of workers to be used.
+
+    Examples
+    --------
+    >>> from awswrangler._utils import ensure_worker_count
+    >>> ensure_worker_count(use_threads=True, num_tasks=1_000)
+    256
+    >>> ensure_worker_count(use_threads=False, num_tasks=1_000)
+    1
+
+    """
+    if type(use_threads) == int:  # pylint: disable=unidiomatic-typecheck
+        if use_threads < 1:
+            return 1
+        return use_threads
+    cpus: int = ensure_cpu_count(use_threads=use_threads)
+    if (use_threads is False) or (num_tasks is None):
+        return cpus
+    return max(cpus, min(256, num_tasks))
+
+
+_MAX_EXECUTOR_WORKERS: int = 256  # Matches the ensure_worker_count() task-scaling cap.
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _EXECUTOR  # pylint: disable=global-statement
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=_MAX_EXECUTOR_WORKERS)  # pylint: disable=R1732
+        return _EXECUTOR
+
+
+@atexit.register
+def _shutdown_executor() -> None:
+    if _EXECUTOR is not None:
+        _EXECUTOR.shutdown(wait=True)
+
+
+def executor_map(fn: Callable[..., Any], *iterables: Iterable[Any], max_workers: int) -> List[Any]:
+    """Map fn over the iterables on the shared thread pool, bounding this call's concurrency.
+
+    A single process-wide pool backs every call, so the threads (and the warmed botocore
+    connection pools they hold) survive between operations instead of being spawned and
+    joined per invocation, while the submission window keeps each call at its own
+    requested concurrency. Workers start on demand, so an idle pool costs no threads.
+    If a task fails, queued tasks are cancelled and in-flight ones drained before the
+    first exception is re-raised, so no work is left running detached in the pool.
+    """
+    executor: ThreadPoolExecutor = _get_executor()
+    window: int = max(1, min(max_workers, _MAX_EXECUTOR_WORKERS))
+    running: Deque[Future] = collections.deque()  # type: ignore
+    results: List[Any] = []
+    try:
+        for args in zip(*iterables):
+            if len(running) >= window:
+                results.append(running.popleft().result())
+            running.append(executor.submit(fn, *args))
+        while running:
+            results.append(running.popleft().result())
+    except BaseException:
+        for future in running:
+            future.cancel()
+        wait(tuple(running))
+        raise
+    return results
+
+
 def chunkify(lst: List[Any], num_chunks: int = 1, max_length: Optional[int] = None) -> List[List[Any]]:
     """Split a list in a List of List (chunks) with even sizes.
 
@@ -1,8 +1,8 @@
 """Amazon S3 CopDeletey Module (PRIVATE)."""
 
-import concurrent.futures
+import collections
 import datetime
-import itertools
+import functools
 import logging
 import time
 from typing import Any, Dict, List, Optional, Union
@@ -18,13 +18,11 @@ _logger: logging.Logger = logging.getLogger(__name__)
 
 
 def _split_paths_by_bucket(paths: List[str]) -> Dict[str, List[str]]:
-    buckets: Dict[str, List[str]] = {}
+    buckets: Dict[str, List[str]] = collections.defaultdict(list)
     bucket: str
     key: str
     for path in paths:
         bucket, key = _utils.parse_path(path=path)
-        if bucket not in buckets:
-            buckets[bucket] = []
         buckets[bucket].append(key)
     return buckets
 
@@ -45,10 +43,8 @@ def _delete_objects(
         )
     else:
         extra_kwargs = {}
-    res = client_s3.delete_objects(Bucket=bucket, Delete={"Objects": batch}, **extra_kwargs)
-    deleted: List[Dict[str, Any]] = res.get("Deleted", [])
-    for obj in deleted:
-        _logger.debug("s3://%s/%s has been deleted.", bucket, obj.get("Key"))
+    # Quiet mode: only failed deletions are reported back, shrinking the response to be parsed.
+    res = client_s3.delete_objects(Bucket=bucket, Delete={"Objects": batch, "Quiet": True}, **extra_kwargs)
     errors: List[Dict[str, Any]] = res.get("Errors", [])
     internal_errors: List[str] = []
     for error in errors:
@@ -99,8 +95,8 @@ def delete_objects(
 
     Note
     ----
-    In case of `use_threads=True` the number of threads
-    that will be spawned will be gotten from os.cpu_count().
+    In case of `use_threads=True` the number of threads scales with
+    the number of 1,000-key delete batches, up to a cap of 256.
 
     Note
     ----
@@ -113,7 +109,8 @@ def delete_objects(
         (e.g. s3://bucket/prefix) or list of S3 objects paths (e.g. [s3://bucket/key0, s3://bucket/key1]).
     use_threads : bool, int
         True to enable concurrent requests, False to disable multiple threads.
-        If enabled os.cpu_count() will be used as the max number of threads.
+        If enabled, threads scale with the number of 1,000-key delete batches,
+        up to a cap of 256.
         If integer is provided, specified number is used.
     last_modified_begin
         Filter the s3 files by the Last modified date of the object.
@@ -161,14 +158,11 @@ def delete_objects(
                     bucket=bucket, keys=chunk, boto3_session=boto3_session, s3_additional_kwargs=s3_additional_kwargs
                 )
         else:
-            cpus: int = _utils.ensure_cpu_count(use_threads=use_threads)
-            with concurrent.futures.ThreadPoolExecutor(max_workers=cpus) as executor:
-                list(
-                    executor.map(
-                        _delete_objects_concurrent,
-                        itertools.repeat(bucket),
-                        chunks,
-                        itertools.repeat(s3_additional_kwargs),
-                        itertools.repeat(_utils.boto3_to_primitives(boto3_session=boto3_session)),
-                    )
-                )
+            workers: int = _utils.ensure_worker_count(use_threads=use_threads, num_tasks=len(chunks))
+            concurrent_delete = functools.partial(
+                _delete_objects_concurrent,
+                bucket,
+                s3_additional_kwargs=s3_additional_kwargs,
+                boto3_primitives=_utils.boto3_to_primitives(boto3_session=boto3_session),
+            )
+            _utils.executor_map(concurrent_delete, chunks, max_workers=workers)
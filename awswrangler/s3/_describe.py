@@ -1,27 +1,31 @@
 """Amazon S3 Describe Module (INTERNAL)."""
 
-import concurrent.futures
 import datetime
-import itertools
+import fnmatch
+import functools
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Union
+import math
+import os
+import random
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import boto3
 
 from awswrangler import _utils
 from awswrangler.s3 import _fs
-from awswrangler.s3._list import _path2list
+from awswrangler.s3._list import _list_objects_prefetch_pages, _path2list, _prefix_cleanup
 
 _logger: logging.Logger = logging.getLogger(__name__)
 
 
 def _describe_object(
     path: str,
-    boto3_session: boto3.Session,
+    version_id: Optional[str],
+    client_s3: boto3.client,
     s3_additional_kwargs: Optional[Dict[str, Any]],
-    version_id: Optional[str] = None,
-) -> Tuple[str, Dict[str, Any]]:
-    client_s3: boto3.client = _utils.client(service_name="s3", session=boto3_session)
+    raise_on_absence: bool = True,
+) -> Tuple[str, Optional[Dict[str, Any]]]:
     bucket: str
     key: str
     bucket, key = _utils.parse_path(path=path)
@@ -34,22 +38,118 @@ def _describe_object(
     desc: Dict[str, Any]
     if version_id:
         extra_kwargs["VersionId"] = version_id
-    desc = _utils.try_it(
-        f=client_s3.head_object, ex=client_s3.exceptions.NoSuchKey, Bucket=bucket, Key=key, **extra_kwargs
-    )
+    try:
+        desc = client_s3.head_object(Bucket=bucket, Key=key, **extra_kwargs)
+    except client_s3.exceptions.NoSuchKey:
+        if raise_on_absence:
+            raise
+        return path, None  # Deferred: describe_objects() retries the whole batch at once.
     return path, desc
 
 
-def _describe_object_concurrent(
+def _describe_objects_from_list(
     path: str,
-    boto3_primitives: _utils.Boto3PrimitivesType,
+    boto3_session: Optional[boto3.Session],
     s3_additional_kwargs: Optional[Dict[str, Any]],
-    version_id: Optional[str] = None,
-) -> Tuple[str, Dict[str, Any]]:
-    boto3_session = _utils.boto3_from_primitives(primitives=boto3_primitives)
-    return _describe_object(
-        path=path, boto3_session=boto3_session, s3_additional_kwargs=s3_additional_kwargs, version_id=version_id
-    )
+) -> Dict[str, Dict[str, Any]]:
+    """Describe all objects under a prefix from a single paginated ListObjectsV2 chain.
+
+    LIST returns Size, LastModified, ETag and StorageClass for up to 1000 keys per
+    request, amortizing what would otherwise be one head_object round-trip per key.
+    Head-only attributes (e.g. ContentType, Metadata, VersionId) are NOT included,
+    so this helper only fits callers that consume the LIST subset (Size is exposed
+    as ContentLength for head_object compatibility).
+    """
+    client_s3: boto3.client = _utils.client(service_name="s3", session=boto3_session)
+    bucket: str
+    prefix_original: str
+    bucket, prefix_original = _utils.parse_path(path=path)
+    prefix: str = _prefix_cleanup(prefix=prefix_original)
+    if s3_additional_kwargs:
+        extra_kwargs: Dict[str, Any] = _fs.get_botocore_valid_kwargs(
+            function_name="list_objects_v2", s3_additional_kwargs=s3_additional_kwargs
+        )
+    else:
+        extra_kwargs = {}
+    args: Dict[str, Any] = {"Bucket": bucket, "Prefix": prefix, **extra_kwargs}
+    desc_dict: Dict[str, Dict[str, Any]] = {}
+    for page in _list_objects_prefetch_pages(client_s3=client_s3, args=args, page_size=1000):
+        for content in page.get("Contents", []):
+            key: str = content["Key"]
+            if key.endswith("/"):  # Directory markers are skipped, mirroring _path2list().
+                continue
+            obj_path: str = f"s3://{bucket}/{key}"
+            if (prefix != prefix_original) and (fnmatch.fnmatch(obj_path, path) is False):
+                continue
+            desc_dict[obj_path] = {
+                "ContentLength": content["Size"],
+                "LastModified": content.get("LastModified"),
+                "ETag": content.get("ETag"),
+                "StorageClass": content.get("StorageClass"),
+            }
+    return desc_dict
+
+
+def _size_objects_from_listing(
+    paths: List[str],
+    use_threads: Union[bool, int],
+    boto3_session: Optional[boto3.Session],
+    s3_additional_kwargs: Optional[Dict[str, Any]],
+) -> Dict[str, Optional[int]]:
+    """Resolve object sizes for a list of paths from bulk listings instead of per-key HEADs.
+
+    Same strategy as objects_exist(): paths are grouped by bucket and matched against a
+    paginated listing of their longest common prefix, capped at roughly the HEAD budget
+    it replaces so a shallow prefix over a huge keyspace can not regress into an
+    unbounded scan. Keys left unresolved by the listing (cap hit, missing, or sharing
+    no usable prefix) fall back to head_object, preserving the error raised for paths
+    that do not exist.
+    """
+    client_s3: boto3.client = _utils.client(service_name="s3", session=boto3_session)
+    if s3_additional_kwargs:
+        extra_kwargs: Dict[str, Any] = _fs.get_botocore_valid_kwargs(
+            function_name="list_objects_v2", s3_additional_kwargs=s3_additional_kwargs
+        )
+    else:
+        extra_kwargs = {}
+    buckets: Dict[str, List[str]] = {}
+    for path in paths:
+        bucket, key = _utils.parse_path(path=path)
+        buckets.setdefault(bucket, []).append(key)
+    size_dict: Dict[str, Optional[int]] = {}
+    missing: List[str] = []
+    for bucket, keys in buckets.items():
+        prefix: str = _prefix_cleanup(prefix=os.path.commonprefix(keys))
+        if not prefix:  # Scattered keys: listing the whole bucket would cost more than HEADs.
+            missing += [f"s3://{bucket}/{key}" for key in keys]
+            continue
+        wanted: Set[str] = set(keys)
+        found: Dict[str, int] = {}
+        page_budget: int = math.ceil(len(keys) / 1_000) + 1
+        args: Dict[str, Any] = {"Bucket": bucket, "Prefix": prefix, **extra_kwargs}
+        for page in _list_objects_prefetch_pages(client_s3=client_s3, args=args, page_size=1000):
+            for content in page.get("Contents", []):
+                if content["Key"] in wanted:
+                    found[content["Key"]] = content["Size"]
+            if len(found) == len(wanted):
+                break
+            page_budget -= 1
+            if page_budget < 1:  # Prefix too shallow: the HEAD fallback below is cheaper.
+                break
+        for key in keys:
+            if key in found:
+                size_dict[f"s3://{bucket}/{key}"] = found[key]
+            else:
+                missing.append(f"s3://{bucket}/{key}")
+    if missing:
+        desc_dict: Dict[str, Dict[str, Any]] = describe_objects(
+            path=missing,
+            use_threads=use_threads,
+            boto3_session=boto3_session,
+            s3_additional_kwargs=s3_additional_kwargs,
+        )
+        size_dict.update({k: d.get("ContentLength", None) for k, d in desc_dict.items()})
+    return size_dict
 
 
 def describe_objects(
@@ -75,8 +175,8 @@ def describe_objects(
 
     Note
     ----
-    In case of `use_threads=True` the number of threads
-    that will be spawned will be gotten from os.cpu_count().
+    In case of `use_threads=True` the number of threads scales
+    with the number of objects, up to a cap of 64.
 
     Note
     ----
@@ -92,7 +192,7 @@ def describe_objects(
         (e.g. {'s3://bucket/key0': '121212', 's3://bucket/key1': '343434'})
     use_threads : bool, int
         True to enable concurrent requests, False to disable multiple threads.
-        If enabled os.cpu_count() will be used as the max number of threads.
+        If enabled, threads scale with the number of objects, up to a cap of 64.
         If integer is provided, specified number is used.
     last_modified_begin
         Filter the s3 files by the Last modified date of the object.
@@ -129,40 +229,61 @@ def describe_objects(
     )
     if len(paths) < 1:
         return {}
-    resp_list: List[Tuple[str, Dict[str, Any]]]
-    if len(paths) == 1:
-        resp_list = [
-            _describe_object(
-                path=paths[0],
-                version_id=version_id.get(paths[0]) if isinstance(version_id, dict) else version_id,
-                boto3_session=boto3_session,
-                s3_additional_kwargs=s3_additional_kwargs,
-            )
-        ]
-    elif use_threads is False:
-        resp_list = [
-            _describe_object(
-                path=p,
-                version_id=version_id.get(p) if isinstance(version_id, dict) else version_id,
-                boto3_session=boto3_session,
+    # One client for all workers: boto3 clients are thread-safe and construction is
+    # GIL-bound, so a client per task would serialize the fan-out it should feed.
+    client_s3: boto3.client = _utils.client(service_name="s3", session=boto3_session)
+    desc_dict: Dict[str, Dict[str, Any]] = {}
+    pending: List[Tuple[str, Optional[str]]] = [
+        (p, version_id.get(p) if isinstance(version_id, dict) else version_id) for p in paths
+    ]
+    resp_list: List[Tuple[str, Optional[Dict[str, Any]]]]
+    base: float = 1.0  # Same retry budget and decorrelated jitter as _utils.try_it().
+    delay: float = base
+    max_num_tries: int = 3
+    for attempt in range(max_num_tries):
+        raise_on_absence: bool = attempt == (max_num_tries - 1)
+        if (len(pending) == 1) or (use_threads is False):
+            resp_list = [
+                _describe_object(
+                    path=p,
+                    version_id=v,
+                    client_s3=client_s3,
+                    s3_additional_kwargs=s3_additional_kwargs,
+                    raise_on_absence=raise_on_absence,
+                )
+                for p, v in pending
+            ]
+        else:
+            workers: int
+            if type(use_threads) == int:  # pylint: disable=unidiomatic-typecheck
+                workers = _utils.ensure_worker_count(use_threads=use_threads)
+            else:
+                # Capped at the shared client's HTTPS connection pool
+                # (default_botocore_config: max_pool_connections=64); workers beyond
+                # that just churn extra connections. An explicit integer is used as-is.
+                workers = min(64, _utils.ensure_worker_count(use_threads=use_threads, num_tasks=len(pending)))
+            concurrent_describe = functools.partial(
+                _describe_object,
+                client_s3=client_s3,
                 s3_additional_kwargs=s3_additional_kwargs,
+                raise_on_absence=raise_on_absence,
             )
-            for p in paths
-        ]
-    else:
-        cpus: int = _utils.ensure_cpu_count(use_threads=use_threads)
-        versions = [version_id.get(p) if isinstance(version_id, dict) else version_id for p in paths]
-        with concurrent.futures.ThreadPoolExecutor(max_workers=cpus) as executor:
-            resp_list = list(
-                executor.map(
-                    _describe_object_concurrent,
-                    paths,
-                    versions,
-                    itertools.repeat(_utils.boto3_to_primitives(boto3_session=boto3_session)),
-                    itertools.repeat(s3_additional_kwargs),
-                )
+            resp_list = _utils.executor_map(
+                concurrent_describe, [p for p, _ in pending], [v for _, v in pending], max_workers=workers
             )
-    desc_dict: Dict[str, Dict[str, Any]] = dict(resp_list)
+        still_pending: List[Tuple[str, Optional[str]]] = []
+        for (p, v), (_, desc) in zip(pending, resp_list):
+            if desc is None:
+                still_pending.append((p, v))
+            else:
+                desc_dict[p] = desc
+        if not still_pending:
+            break
+        pending = still_pending
+        # Eventual-consistency misses sleep once per round for the whole batch instead of
+        # once per path inside the worker, so a wave of misses costs ~one delay, not N.
+        delay = random.uniform(base, delay * 3)
+        time.sleep(delay)
     return desc_dict
 
 
@@ -183,8 +304,8 @@ def size_objects(
 
     Note
     ----
-    In case of `use_threads=True` the number of threads
-    that will be spawned will be gotten from os.cpu_count().
+    In case of `use_threads=True` the number of threads scales
+    with the number of objects, up to a cap of 64.
 
     Parameters
     ----------
@@ -196,7 +317,7 @@ def size_objects(
         (e.g. {'s3://bucket/key0': '121212', 's3://bucket/key1': '343434'})
     use_threads : bool, int
         True to enable concurrent requests, False to disable multiple threads.
-        If enabled os.cpu_count() will be used as the max number of threads.
+        If enabled, threads scale with the number of objects, up to a cap of 64.
         If integer is provided, specified number is used.
     s3_additional_kwargs : Optional[Dict[str, Any]]
         Forwarded to botocore requests.
@@ -216,6 +337,21 @@ def size_objects(
     >>> sizes1 = wr.s3.size_objects('s3://bucket/prefix')  # Get the sizes of all objects under the received prefix
 
     """
+    if version_id is None:
+        # Sizes come for free on ListObjectsV2, so both prefix and list inputs take
+        # ~1 LIST request per 1000 keys instead of one HEAD per key.
+        if isinstance(path, str):
+            desc_dict: Dict[str, Dict[str, Any]] = _describe_objects_from_list(
+                path=path, boto3_session=boto3_session, s3_additional_kwargs=s3_additional_kwargs
+            )
+            return {k: d.get("ContentLength", None) for k, d in desc_dict.items()}
+        if len(path) > 0:
+            return _size_objects_from_listing(
+                paths=path,
+                use_threads=use_threads,
+                boto3_session=boto3_session,
+                s3_additional_kwargs=s3_additional_kwargs,
+            )
     desc_list: Dict[str, Dict[str, Any]] = describe_objects(
         path=path,
         version_id=version_id,
@@ -284,6 +284,9 @@ class _S3ObjectBase(io.RawIOBase):  # pylint: disable=too-many-instance-attribut
         for size in sizes:
             ranges.append((chunk_start, chunk_start + size))
             chunk_start += size
+        # Not routed through _utils.get_executor(): ranged fetches can run inside a worker
+        # of a shared pool (e.g. parallel multi-path reads) and sharing would risk a
+        # deadlock of outer tasks waiting on inner tasks queued behind them.
         with concurrent.futures.ThreadPoolExecutor(max_workers=cpus) as executor:
             return self._merge_range(
                 ranges=list(
@@ -387,6 +390,33 @@ class _S3ObjectBase(io.RawIOBase):  # pylint: disable=too-many-instance-attribut
         self._loc = loc_tmp
         return self._loc
 
+    def _create_multipart_upload(self) -> None:
+        self._mpu = self._mpu or _utils.try_it(
+            f=self._client.create_multipart_upload,
+            ex=_S3_RETRYABLE_ERRORS,
+            base=0.5,
+            max_num_tries=6,
+            Bucket=self._bucket,
+            Key=self._key,
+            **get_botocore_valid_kwargs(
+                function_name="create_multipart_upload", s3_additional_kwargs=self._s3_additional_kwargs
+            ),
+        )
+
+    def _submit_upload_part(self, data: Union[bytes, bytearray]) -> None:
+        self._parts_count += 1
+        self._upload_proxy.upload(
+            bucket=self._bucket,
+            key=self._key,
+            part=self._parts_count,
+            upload_id=self._mpu["UploadId"],
+            data=data,
+            boto3_session=self._boto3_session,
+            boto3_kwargs=get_botocore_valid_kwargs(
+                function_name="upload_part", s3_additional_kwargs=self._s3_additional_kwargs
+            ),
+        )
+
     def flush(self, force: bool = False) -> None:
         """Write buffered data to S3."""
         if self.closed:  # pylint: disable=using-constant-test
@@ -398,34 +428,13 @@ class _S3ObjectBase(io.RawIOBase):  # pylint: disable=too-many-instance-attribut
             if total_size == 0:
                 return None
             _logger.debug("Flushing: %s bytes", total_size)
-            self._mpu = self._mpu or _utils.try_it(
-                f=self._client.create_multipart_upload,
-                ex=_S3_RETRYABLE_ERRORS,
-                base=0.5,
-                max_num_tries=6,
-                Bucket=self._bucket,
-                Key=self._key,
-                **get_botocore_valid_kwargs(
-                    function_name="create_multipart_upload", s3_additional_kwargs=self._s3_additional_kwargs
-                ),
-            )
+            self._create_multipart_upload()
             self._buffer.seek(0)
             for chunk_size in _utils.get_even_chunks_sizes(
                 total_size=total_size, chunk_size=_MIN_WRITE_BLOCK, upper_bound=False
             ):
                 _logger.debug("chunk_size: %s bytes", chunk_size)
-                self._parts_count += 1
-                self._upload_proxy.upload(
-                    bucket=self._bucket,
-                    key=self._key,
-                    part=self._parts_count,
-                    upload_id=self._mpu["UploadId"],
-                    data=self._buffer.read(chunk_size),
-                    boto3_session=self._boto3_session,
-                    boto3_kwargs=get_botocore_valid_kwargs(
-                        function_name="upload_part", s3_additional_kwargs=self._s3_additional_kwargs
-                    ),
-                )
+                self._submit_upload_part(data=self._buffer.read(chunk_size))
             self._buffer.seek(0)
             self._buffer.truncate(0)
             self._buffer.close()
@@ -535,6 +544,20 @@ class _S3ObjectBase(io.RawIOBase):  # pylint: disable=too-many-instance-attribut
             raise RuntimeError("File not in write mode.")
         if self.closed:  # pylint: disable=using-constant-test
             raise RuntimeError("I/O operation on closed file.")
+        total_size: int = len(data)
+        if self._buffer.tell() == 0 and total_size >= _MIN_WRITE_BLOCK:
+            # Nothing staged and the payload already covers at least one part: slice it
+            # straight into upload parts, skipping one full copy through the buffer.
+            self._create_multipart_upload()
+            offset: int = 0
+            for chunk_size in _utils.get_even_chunks_sizes(
+                total_size=total_size, chunk_size=_MIN_WRITE_BLOCK, upper_bound=False
+            ):
+                chunk = data[offset : offset + chunk_size]
+                self._submit_upload_part(data=chunk if isinstance(chunk, (bytes, bytearray)) else bytes(chunk))
+                offset += chunk_size
+            self._loc += total_size
+            return total_size
         n: int = self._buffer.write(data)
         self._loc += n
         if self._buffer.tell() >= _MIN_WRITE_BLOCK:
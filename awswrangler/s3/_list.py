@@ -1,9 +1,12 @@
 """Amazon S3 List Module (PRIVATE)."""
 
+import concurrent.futures
 import datetime
 import fnmatch
 import logging
-from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+import math
+import os
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 import boto3
 import botocore.exceptions
@@ -14,6 +17,13 @@ from awswrangler.s3 import _fs
 _logger: logging.Logger = logging.getLogger(__name__)
 
 
+def _suffix_tuple(suffix: Union[str, Sequence[str], None]) -> Optional[Tuple[str, ...]]:
+    """Normalize a suffix argument to the tuple form expected by str.endswith()."""
+    if suffix is None:
+        return None
+    return (suffix,) if isinstance(suffix, str) else tuple(suffix)
+
+
 def _path2list(
     path: Union[str, Sequence[str]],
     boto3_session: boto3.Session,
@@ -43,8 +53,10 @@ def _path2list(
             raise exceptions.InvalidArgumentCombination(
                 "Specify a list of files or (last_modified_begin and last_modified_end)"
             )
-        paths = path if _suffix is None else [x for x in path if x.endswith(tuple(_suffix))]
-        paths = path if _ignore_suffix is None else [x for x in paths if x.endswith(tuple(_ignore_suffix)) is False]
+        suffix_t: Optional[Tuple[str, ...]] = _suffix_tuple(suffix=_suffix)
+        ignore_suffix_t: Optional[Tuple[str, ...]] = _suffix_tuple(suffix=_ignore_suffix)
+        paths = path if suffix_t is None else [x for x in path if x.endswith(suffix_t)]
+        paths = path if ignore_suffix_t is None else [x for x in paths if x.endswith(ignore_suffix_t) is False]
     else:
         raise exceptions.InvalidArgumentType(f"{type(path)} is not a valid path type. Please, use str or List[str].")
     return paths
@@ -69,6 +81,27 @@ def _prefix_cleanup(prefix: str) -> str:
     return prefix
 
 
+def _list_objects_prefetch_pages(
+    client_s3: boto3.client, args: Dict[str, Any], page_size: int
+) -> Iterator[Dict[str, Any]]:
+    """Paginate ListObjectsV2 requesting the next page while the current one is being consumed.
+
+    Each request only depends on the NextContinuationToken of the previous response, so as soon
+    as a page arrives the following one can be fetched in background, hiding one round-trip per page.
+    """
+    kwargs: Dict[str, Any] = {**args, "MaxKeys": page_size}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(client_s3.list_objects_v2, **kwargs)
+        while True:
+            response: Dict[str, Any] = future.result()
+            token: Optional[str] = response.get("NextContinuationToken")
+            if token is not None:
+                future = executor.submit(client_s3.list_objects_v2, ContinuationToken=token, **kwargs)
+            yield response
+            if token is None:
+                break
+
+
 def _list_objects(  # pylint: disable=too-many-branches
     path: str,
     s3_additional_kwargs: Optional[Dict[str, Any]],
@@ -84,59 +117,71 @@ def _list_objects(  # pylint: disable=too-many-branches
     prefix_original: str
     bucket, prefix_original = _utils.parse_path(path=path)
     prefix: str = _prefix_cleanup(prefix=prefix_original)
-    _suffix: Union[List[str], None] = [suffix] if isinstance(suffix, str) else suffix
-    _ignore_suffix: Union[List[str], None] = [ignore_suffix] if isinstance(ignore_suffix, str) else ignore_suffix
+    _suffix: Optional[Tuple[str, ...]] = _suffix_tuple(suffix=suffix)
+    _ignore_suffix: Optional[Tuple[str, ...]] = _suffix_tuple(suffix=ignore_suffix)
     client_s3: boto3.client = _utils.client(service_name="s3", session=boto3_session)
-    default_pagination: Dict[str, int] = {"PageSize": 1000}
-    extra_kwargs: Dict[str, Any] = {"PaginationConfig": default_pagination}
+    pagination_config: Dict[str, Any] = {"PageSize": 1000}
     if s3_additional_kwargs:
-        extra_kwargs = _fs.get_botocore_valid_kwargs(
+        extra_kwargs: Dict[str, Any] = _fs.get_botocore_valid_kwargs(
             function_name="list_objects_v2", s3_additional_kwargs=s3_additional_kwargs
         )
-        extra_kwargs["PaginationConfig"] = (
-            s3_additional_kwargs["PaginationConfig"]
-            if "PaginationConfig" in s3_additional_kwargs
-            else default_pagination
-        )
-    paginator = client_s3.get_paginator("list_objects_v2")
+        if "PaginationConfig" in s3_additional_kwargs:
+            pagination_config = s3_additional_kwargs["PaginationConfig"]
+    else:
+        extra_kwargs = {}
     args: Dict[str, Any] = {"Bucket": bucket, "Prefix": prefix, **extra_kwargs}
     if delimiter is not None:
         args["Delimiter"] = delimiter
     _logger.debug("args: %s", args)
-    response_iterator = paginator.paginate(**args)
+    response_iterator: Iterator[Dict[str, Any]]
+    if set(pagination_config) <= {"PageSize"}:
+        response_iterator = _list_objects_prefetch_pages(
+            client_s3=client_s3, args=args, page_size=pagination_config.get("PageSize", 1000)
+        )
+    else:  # Custom pagination (e.g. MaxItems/StartingToken) is delegated to the boto3 paginator.
+        paginator = client_s3.get_paginator("list_objects_v2")
+        response_iterator = paginator.paginate(PaginationConfig=pagination_config, **args)
     paths: List[str] = []
     _validate_datetimes(last_modified_begin=last_modified_begin, last_modified_end=last_modified_end)
 
+    filtering: bool = (
+        (ignore_empty is True)
+        or (_suffix is not None)
+        or (last_modified_begin is not None)
+        or (last_modified_end is not None)
+    )
+
     for page in response_iterator:  # pylint: disable=too-many-nested-blocks
         if delimiter is None:
             contents: Optional[List[Dict[str, Any]]] = page.get("Contents")
             if contents is not None:
-                for content in contents:
-                    key: str = content["Key"]
-                    if ignore_empty and content.get("Size", 0) == 0:
-                        _logger.debug("Skipping empty file: %s", f"s3://{bucket}/{key}")
-                    elif (content is not None) and ("Key" in content):
-                        if (_suffix is None) or key.endswith(tuple(_suffix)):
-                            if last_modified_begin is not None:
-                                if content["LastModified"] < last_modified_begin:
-                                    continue
-                            if last_modified_end is not None:
-                                if content["LastModified"] > last_modified_end:
-                                    continue
-                            paths.append(f"s3://{bucket}/{key}")
+                if filtering is False:
+                    # Fast path: no per-key filtering required.
+                    paths = [f"s3://{bucket}/{content['Key']}" for content in contents]
+                else:
+                    for content in contents:
+                        key: str = content["Key"]
+                        if ignore_empty and content.get("Size", 0) == 0:
+                            _logger.debug("Skipping empty file: %s", f"s3://{bucket}/{key}")
+                        elif (content is not None) and ("Key" in content):
+                            if (_suffix is None) or key.endswith(_suffix):
+                                if last_modified_begin is not None:
+                                    if content["LastModified"] < last_modified_begin:
+                                        continue
+                                if last_modified_end is not None:
+                                    if content["LastModified"] > last_modified_end:
+                                        continue
+                                paths.append(f"s3://{bucket}/{key}")
         else:
             prefixes: Optional[List[Optional[Dict[str, str]]]] = page.get("CommonPrefixes")
             if prefixes is not None:
-                for pfx in prefixes:
-                    if (pfx is not None) and ("Prefix" in pfx):
-                        key = pfx["Prefix"]
-                        paths.append(f"s3://{bucket}/{key}")
+                paths = [f"s3://{bucket}/{pfx['Prefix']}" for pfx in prefixes if pfx is not None and "Prefix" in pfx]
 
         if prefix != prefix_original:
             paths = fnmatch.filter(paths, path)
 
         if _ignore_suffix is not None:
-            paths = [p for p in paths if p.endswith(tuple(_ignore_suffix)) is False]
+            paths = [p for p in paths if p.endswith(_ignore_suffix) is False]
 
         if paths:
             yield paths
@@ -209,6 +254,80 @@ def does_object_exist(
         raise ex
 
 
+def objects_exist(
+    paths: List[str],
+    s3_additional_kwargs: Optional[Dict[str, Any]] = None,
+    boto3_session: Optional[boto3.Session] = None,
+) -> Dict[str, bool]:
+    """Check if objects exist on S3 in bulk.
+
+    Instead of issuing one head_object request per path, the received paths are grouped
+    by bucket and checked against a single paginated listing of their longest common
+    prefix, turning N round-trips into ~1 LIST request per 1000 sibling keys.
+    The closer the paths are to each other (e.g. siblings under the same prefix),
+    the fewer requests are needed. When the paths share no usable prefix, or the
+    prefix is so shallow that listing it would cost more requests than checking the
+    keys directly, the remaining paths fall back to per-key head_object checks.
+
+    Parameters
+    ----------
+    paths : List[str]
+        List of S3 objects paths (e.g. [s3://bucket/key0, s3://bucket/key1]).
+    s3_additional_kwargs : Optional[Dict[str, Any]]
+        Forwarded to botocore requests.
+        e.g. s3_additional_kwargs={'RequestPayer': 'requester'}
+    boto3_session : boto3.Session(), optional
+        Boto3 Session. The default boto3 session will be used if boto3_session receive None.
+
+    Returns
+    -------
+    Dict[str, bool]
+        Dictionary where the key is the object path and the value is the existence flag.
+
+    Examples
+    --------
+    >>> import awswrangler as wr
+    >>> wr.s3.objects_exist(['s3://bucket/key_real', 's3://bucket/key_unreal'])
+    {'s3://bucket/key_real': True, 's3://bucket/key_unreal': False}
+
+    """
+    buckets: Dict[str, List[str]] = {}
+    for path in paths:
+        bucket, key = _utils.parse_path(path=path)
+        buckets.setdefault(bucket, []).append(key)
+    response: Dict[str, bool] = {}
+    for bucket, keys in buckets.items():
+        prefix: str = _prefix_cleanup(prefix=os.path.commonprefix(keys))
+        existing: Set[str] = set()
+        listing_complete: bool = False
+        if prefix:  # An empty prefix would list the whole bucket, costing more than HEADs.
+            # Cap the listing at roughly the HEAD budget it replaces: past that point the
+            # common prefix is too shallow and the per-key fallback is cheaper.
+            page_budget: int = math.ceil(len(keys) / 1_000) + 1
+            listing_complete = True
+            for page_paths in _list_objects(
+                path=f"s3://{bucket}/{prefix}",
+                s3_additional_kwargs=s3_additional_kwargs,
+                boto3_session=boto3_session,
+            ):
+                existing.update(page_paths)
+                page_budget -= 1
+                if page_budget < 1:
+                    listing_complete = False
+                    break
+        for key in keys:
+            path = f"s3://{bucket}/{key}"
+            if path in existing:
+                response[path] = True
+            elif listing_complete:
+                response[path] = False
+            else:
+                response[path] = does_object_exist(
+                    path=path, s3_additional_kwargs=s3_additional_kwargs, boto3_session=boto3_session
+                )
+    return response
+
+
 def list_directories(
     path: str,
     chunked: bool = False,
@@ -1,6 +1,5 @@
 """Amazon S3 Read Module (PRIVATE)."""
 
-import concurrent.futures
 import logging
 from functools import partial
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union, cast
@@ -10,7 +9,7 @@ import pandas as pd
 from pandas.api.types import union_categoricals
 
 from awswrangler import exceptions
-from awswrangler._utils import boto3_to_primitives, ensure_cpu_count
+from awswrangler._utils import boto3_to_primitives, ensure_cpu_count, ensure_worker_count, executor_map
 from awswrangler.s3._list import _prefix_cleanup
 
 _logger: logging.Logger = logging.getLogger(__name__)
@@ -138,8 +137,14 @@ def _read_dfs_from_multiple_paths(
     if cpus < 2:
         return [read_func(path, version_id=version_ids.get(path) if version_ids else None, **kwargs) for path in paths]
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=ensure_cpu_count(use_threads)) as executor:
-        kwargs["boto3_session"] = boto3_to_primitives(kwargs["boto3_session"])
-        partial_read_func = partial(read_func, **kwargs)
-        versions = [version_ids.get(p) if isinstance(version_ids, dict) else None for p in paths]
-        return list(df for df in executor.map(partial_read_func, paths, versions))
+    # Reads mix downloads (network-bound) with parsing (CPU-bound), so with use_threads=True
+    # the worker count scales past os.cpu_count() but is capped lower than metadata-only
+    # operations. An explicit integer is still used as-is.
+    if type(use_threads) == int:  # pylint: disable=unidiomatic-typecheck
+        max_workers = cpus
+    else:
+        max_workers = min(64, ensure_worker_count(use_threads=use_threads, num_tasks=len(paths)))
+    kwargs["boto3_session"] = boto3_to_primitives(kwargs["boto3_session"])
+    partial_read_func = partial(read_func, **kwargs)
+    versions = [version_ids.get(p) if isinstance(version_ids, dict) else None for p in paths]
+    return executor_map(partial_read_func, paths, versions, max_workers=max_workers)
@@ -193,8 +193,8 @@ def read_csv(
 
     Note
     ----
-    In case of `use_threads=True` the number of threads
-    that will be spawned will be gotten from os.cpu_count().
+    In case of `use_threads=True` the number of threads scales
+    with the number of files to be read, up to a cap of 64.
 
     Note
     ----
@@ -218,7 +218,8 @@ def read_csv(
         Ignore files with 0 bytes.
     use_threads : Union[bool, int]
         True to enable concurrent requests, False to disable multiple threads.
-        If enabled os.cpu_count() will be used as the max number of threads.
+        If enabled, threads scale with the number of files to be read, up to a
+        cap of 64.
         If integer is provided, specified number is used.
     last_modified_begin
         Filter the s3 files by the Last modified date of the object.
@@ -341,8 +342,8 @@ def read_fwf(
 
     Note
     ----
-    In case of `use_threads=True` the number of threads
-    that will be spawned will be gotten from os.cpu_count().
+    In case of `use_threads=True` the number of threads scales
+    with the number of files to be read, up to a cap of 64.
 
     Note
     ----
@@ -366,7 +367,8 @@ def read_fwf(
         Ignore files with 0 bytes.
     use_threads : Union[bool, int]
         True to enable concurrent requests, False to disable multiple threads.
-        If enabled os.cpu_count() will be used as the max number of threads.
+        If enabled, threads scale with the number of files to be read, up to a
+        cap of 64.
         If integer is provided, specified number is used.
     last_modified_begin
         Filter the s3 files by the Last modified date of the object.
@@ -490,8 +492,8 @@ def read_json(
 
     Note
     ----
-    In case of `use_threads=True` the number of threads
-    that will be spawned will be gotten from os.cpu_count().
+    In case of `use_threads=True` the number of threads scales
+    with the number of files to be read, up to a cap of 64.
 
     Note
     ----
@@ -517,7 +519,8 @@ def read_json(
         Same as Pandas: https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.read_json.html
     use_threads : Union[bool, int]
         True to enable concurrent requests, False to disable multiple threads.
-        If enabled os.cpu_count() will be used as the max number of threads.
+        If enabled, threads scale with the number of files to be read, up to a
+        cap of 64.
         If integer is provided, specified number is used.
     last_modified_begin
         Filter the s3 files by the Last modified date of the object.
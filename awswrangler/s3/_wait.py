@@ -1,7 +1,6 @@
 """Amazon S3 Wait Module (PRIVATE)."""
 
-import concurrent.futures
-import itertools
+import functools
 import logging
 from typing import List, Optional, Tuple, Union
 
@@ -59,17 +58,14 @@ def _wait_objects(
             )
     else:
         cpus: int = _utils.ensure_cpu_count(use_threads=use_threads)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=cpus) as executor:
-            list(
-                executor.map(
-                    _wait_object_concurrent,
-                    _paths,
-                    itertools.repeat(waiter_name),
-                    itertools.repeat(_delay),
-                    itertools.repeat(max_attempts),
-                    itertools.repeat(_utils.boto3_to_primitives(boto3_session=boto3_session)),
-                )
-            )
+        concurrent_wait = functools.partial(
+            _wait_object_concurrent,
+            waiter_name=waiter_name,
+            delay=_delay,
+            max_attempts=max_attempts,
+            boto3_primitives=_utils.boto3_to_primitives(boto3_session=boto3_session),
+        )
+        _utils.executor_map(concurrent_wait, _paths, max_workers=cpus)
     return None
 
 
@@ -8,7 +8,9 @@ import numpy as np
 import pandas as pd
 
 from awswrangler import exceptions
+from awswrangler._utils import ensure_cpu_count
 from awswrangler.s3._delete import delete_objects
+from awswrangler.s3._list import list_objects
 from awswrangler.s3._write_concurrent import _WriteProxy
 
 _logger: logging.Logger = logging.getLogger(__name__)
@@ -28,20 +30,75 @@ def _to_partitions(
     **func_kwargs: Any,
 ) -> Tuple[List[str], Dict[str, List[str]]]:
     partitions_values: Dict[str, List[str]] = {}
-    proxy: _WriteProxy = _WriteProxy(use_threads=concurrent_partitioning)
 
-    for keys, subgroup in df.groupby(by=partition_cols, observed=True):
-        subgroup = subgroup.drop(partition_cols, axis="columns")
+    # Group with the partition columns already dropped: grouping the residual frame by the
+    # partition Series avoids one subgroup.drop() DataFrame copy per partition.
+    partition_series = [df[col] for col in partition_cols]
+    grouped = df.drop(partition_cols, axis="columns").groupby(by=partition_series, observed=True)
+
+    proxy: _WriteProxy
+    write_use_threads: Union[bool, int]
+    if concurrent_partitioning:
+        proxy = _WriteProxy(use_threads=concurrent_partitioning)
+        # When partitions are already being written in parallel, each per-partition writer runs
+        # with use_threads=False so the partition pool is not oversubscribed by nested pools.
+        write_use_threads = False
+    elif (grouped.ngroups > 1) and (use_threads is True) and (ensure_cpu_count(use_threads=use_threads) > 1):
+        # Two-deep pipeline: partition i+1's pandas->Arrow conversion overlaps partition i's
+        # upload. proxy.write() blocks once two partitions are in flight, so the memory
+        # overhead is capped at a single extra partition. Only engaged for use_threads=True:
+        # an explicit integer is a hard thread budget and the pipeline would exceed it.
+        proxy = _WriteProxy(use_threads=2)
+        write_use_threads = use_threads
+    else:
+        proxy = _WriteProxy(use_threads=False)
+        write_use_threads = use_threads
+
+    # With several partitions to overwrite, one LIST of the dataset root replaces
+    # one LIST per partition prefix on the delete side. The root listing is capped at
+    # roughly the number of LIST requests it replaces: if the dataset holds more
+    # partitions than this write touches, listing them all would cost more than the
+    # per-prefix LISTs saved, so the loop below falls back to per-prefix deletes.
+    existing_by_prefix: Optional[Dict[str, List[str]]] = None
+    if (mode == "overwrite_partitions") and (grouped.ngroups > 1):
+        existing_by_prefix = {}
+        depth: int = len(partition_cols)
+        page_budget: int = grouped.ngroups + 1
+        for page in list_objects(  # type: ignore
+            path=path_root,
+            chunked=True,
+            boto3_session=boto3_session,
+            s3_additional_kwargs=func_kwargs.get("s3_additional_kwargs"),
+        ):
+            page_budget -= 1
+            if page_budget < 0:
+                existing_by_prefix = None
+                break
+            for existing_path in page:
+                parts: List[str] = existing_path[len(path_root) :].split("/", depth)
+                if len(parts) > depth:
+                    partition_prefix: str = f"{path_root}{'/'.join(parts[:depth])}/"
+                    existing_by_prefix.setdefault(partition_prefix, []).append(existing_path)
+
+    for keys, subgroup in grouped:
         keys = (keys,) if not isinstance(keys, tuple) else keys
         subdir = "/".join([f"{name}={val}" for name, val in zip(partition_cols, keys)])
         prefix: str = f"{path_root}{subdir}/"
         if mode == "overwrite_partitions":
-            delete_objects(
-                path=prefix,
-                use_threads=use_threads,
-                boto3_session=boto3_session,
-                s3_additional_kwargs=func_kwargs.get("s3_additional_kwargs"),
-            )
+            if existing_by_prefix is None:
+                delete_objects(
+                    path=prefix,
+                    use_threads=use_threads,
+                    boto3_session=boto3_session,
+                    s3_additional_kwargs=func_kwargs.get("s3_additional_kwargs"),
+                )
+            elif existing_by_prefix.get(prefix):
+                delete_objects(
+                    path=existing_by_prefix[prefix],
+                    use_threads=use_threads,
+                    boto3_session=boto3_session,
+                    s3_additional_kwargs=func_kwargs.get("s3_additional_kwargs"),
+                )
         if bucketing_info:
             _to_buckets(
                 func=func,
@@ -49,7 +106,7 @@ def _to_partitions(
                 path_root=prefix,
                 bucketing_info=bucketing_info,
                 boto3_session=boto3_session,
-                use_threads=use_threads,
+                use_threads=write_use_threads,
                 proxy=proxy,
                 filename_prefix=filename_prefix,
                 **func_kwargs,
@@ -61,7 +118,7 @@ def _to_partitions(
                 path_root=prefix,
                 filename_prefix=filename_prefix,
                 boto3_session=boto3_session,
-                use_threads=use_threads,
+                use_threads=write_use_threads,
                 **func_kwargs,
             )
         partitions_values[prefix] = [str(k) for k in keys]
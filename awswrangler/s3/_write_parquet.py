@@ -24,6 +24,28 @@ from awswrangler.s3._write_dataset import _to_dataset
 _logger: logging.Logger = logging.getLogger(__name__)
 
 
+def _dictionary_encoded_columns(df: pd.DataFrame) -> List[str]:
+    """Choose which columns get parquet dictionary encoding from a head sample.
+
+    Dictionary-encoding a high-cardinality column wastes CPU building a dictionary
+    that immediately spills back to plain encoding, so only columns whose sampled
+    nunique/len ratio shows actual repetition are kept.
+    """
+    sample: pd.DataFrame = df.head(1_000)
+    num_rows: int = len(sample.index)
+    if num_rows == 0:
+        return [str(col) for col in df.columns]
+    columns: List[str] = []
+    for col in sample.columns:
+        try:
+            ratio: float = sample[col].nunique(dropna=False) / num_rows
+        except TypeError:  # Unhashable values (e.g. lists/structs) can not be dictionary-encoded.
+            continue
+        if ratio < 0.5:
+            columns.append(str(col))
+    return columns
+
+
 def _get_file_path(file_counter: int, file_path: str) -> str:
     slash_index: int = file_path.rfind("/")
     dot_index: int = file_path.find(".", slash_index)
@@ -50,6 +72,10 @@ def _new_writer(
         pyarrow_additional_kwargs = {}
     if not pyarrow_additional_kwargs.get("coerce_timestamps"):
         pyarrow_additional_kwargs["coerce_timestamps"] = "ms"
+    if "write_statistics" not in pyarrow_additional_kwargs:
+        pyarrow_additional_kwargs["write_statistics"] = True
+    if "use_dictionary" not in pyarrow_additional_kwargs:
+        pyarrow_additional_kwargs["use_dictionary"] = True
 
     with open_s3_object(
         path=file_path,
@@ -61,8 +87,6 @@ def _new_writer(
         try:
             writer = pyarrow.parquet.ParquetWriter(
                 where=f,
-                write_statistics=True,
-                use_dictionary=True,
                 compression="NONE" if compression is None else compression,
                 flavor="spark",
                 schema=schema,
@@ -84,6 +108,7 @@ def _write_chunk(
     offset: int,
     chunk_size: int,
     use_threads: Union[bool, int],
+    row_group_size: Optional[int] = None,
 ) -> List[str]:
     with _new_writer(
         file_path=file_path,
@@ -94,7 +119,7 @@ def _write_chunk(
         s3_additional_kwargs=s3_additional_kwargs,
         use_threads=use_threads,
     ) as writer:
-        writer.write_table(table.slice(offset, chunk_size))
+        writer.write_table(table.slice(offset, chunk_size), row_group_size=row_group_size)
     return [file_path]
 
 
@@ -108,6 +133,7 @@ def _to_parquet_chunked(
     max_rows_by_file: int,
     num_of_rows: int,
     cpus: int,
+    row_group_size: Optional[int] = None,
 ) -> List[str]:
     chunks: int = math.ceil(num_of_rows / max_rows_by_file)
     use_threads: Union[bool, int] = cpus > 1
@@ -126,6 +152,7 @@ def _to_parquet_chunked(
             offset=offset,
             chunk_size=max_rows_by_file,
             use_threads=use_threads,
+            row_group_size=row_group_size,
         )
     return proxy.close()  # blocking
 
@@ -154,10 +181,14 @@ def _to_parquet(
     else:
         raise RuntimeError("path and path_root received at the same time.")
     _logger.debug("file_path: %s", file_path)
+    pyarrow_additional_kwargs = dict(pyarrow_additional_kwargs) if pyarrow_additional_kwargs else {}
+    row_group_size: Optional[int] = pyarrow_additional_kwargs.pop("row_group_size", None)
+    if "use_dictionary" not in pyarrow_additional_kwargs:
+        pyarrow_additional_kwargs["use_dictionary"] = _dictionary_encoded_columns(df=df)
     table: pa.Table = pyarrow.Table.from_pandas(df=df, schema=schema, nthreads=cpus, preserve_index=index, safe=True)
     for col_name, col_type in dtype.items():
-        if col_name in table.column_names:
-            col_index = table.column_names.index(col_name)
+        col_index = table.schema.get_field_index(col_name)
+        if col_index >= 0:
             pyarrow_dtype = _data_types.athena2pyarrow(col_type)
             field = pa.field(name=col_name, type=pyarrow_dtype)
             table = table.set_column(col_index, field, table.column(col_name).cast(pyarrow_dtype))
@@ -173,6 +204,7 @@ def _to_parquet(
             max_rows_by_file=max_rows_by_file,
             num_of_rows=df.shape[0],
             cpus=cpus,
+            row_group_size=row_group_size,
         )
     else:
         with _new_writer(
@@ -184,7 +216,7 @@ def _to_parquet(
             s3_additional_kwargs=s3_additional_kwargs,
             use_threads=use_threads,
         ) as writer:
-            writer.write_table(table)
+            writer.write_table(table, row_group_size=row_group_size)
         paths = [file_path]
     return paths
 
@@ -264,6 +296,9 @@ def to_parquet(  # pylint: disable=too-many-arguments,too-many-locals
         Additional parameters forwarded to pyarrow.
         e.g. pyarrow_additional_kwargs={'coerce_timestamps': 'ns', 'use_deprecated_int96_timestamps': False,
         'allow_truncated_timestamps'=False}
+        Also accepts the writer tuning keys 'use_dictionary' (bool or list of column names,
+        default: columns whose sampled cardinality shows repetition), 'write_statistics'
+        (default: True) and 'row_group_size' (default: pyarrow's).
     max_rows_by_file : int
         Max number of rows in each file.
         Default is None i.e. dont split the files.
@@ -134,6 +134,13 @@ def test_absent_object(path):
     assert len(wr.s3.size_objects(path=path_file)) == 0
 
 
+def test_objects_exist(path):
+    paths = [f"{path}test_objects_exist_{i}" for i in range(3)]
+    for p in paths[:-1]:
+        wr.s3.to_csv(df=pd.DataFrame({"c0": [1]}), path=p, index=False)
+    assert wr.s3.objects_exist(paths=paths) == {paths[0]: True, paths[1]: True, paths[2]: False}
+
+
 @pytest.mark.parametrize("use_threads", [True, False])
 def test_merge(path, use_threads):
     path1 = f"{path}test_merge/"
@@ -1,9 +1,11 @@
 import logging
 import os
+import threading
+import time
 
 import pytest
 
-from awswrangler._utils import ensure_cpu_count, get_even_chunks_sizes
+from awswrangler._utils import ensure_cpu_count, ensure_worker_count, executor_map, get_even_chunks_sizes, parse_path
 
 logging.getLogger("awswrangler").setLevel(logging.DEBUG)
 
@@ -33,3 +35,75 @@ def test_get_even_chunks_sizes(total_size, chunk_size, upper_bound, result):
 @pytest.mark.parametrize("use_threads,result", [(True, os.cpu_count()), (False, 1), (-1, 1), (1, 1), (5, 5)])
 def test_ensure_cpu_count(use_threads, result):
     assert ensure_cpu_count(use_threads=use_threads) == result
+
+
+@pytest.mark.parametrize(
+    "use_threads,num_tasks,result",
+    [
+        (True, None, os.cpu_count()),
+        (True, 1_000, 256),
+        (True, 2, max(os.cpu_count(), 2)),
+        (False, 1_000, 1),
+        (-1, 1_000, 1),
+        (5, 1_000, 5),
+    ],
+)
+def test_ensure_worker_count(use_threads, num_tasks, result):
+    assert ensure_worker_count(use_threads=use_threads, num_tasks=num_tasks) == result
+
+
+@pytest.mark.parametrize(
+    "path,bucket,key",
+    [
+        ("s3://bucket", "bucket", ""),
+        ("s3://bucket/", "bucket", ""),
+        ("s3://bucket/key", "bucket", "key"),
+        ("s3://bucket/dir/key", "bucket", "dir/key"),
+        (
+            "s3://arn:aws:s3:us-east-1:123456789012:accesspoint/ap-name/key",
+            "arn:aws:s3:us-east-1:123456789012:accesspoint:ap-name",
+            "key",
+        ),
+    ],
+)
+def test_parse_path(path, bucket, key):
+    assert parse_path(path) == (bucket, key)
+
+
+def test_executor_map_ordering():
+    results = executor_map(lambda a, b: (a, b), range(50), range(100, 150), max_workers=8)
+    assert results == [(i, 100 + i) for i in range(50)]
+
+
+def test_executor_map_window():
+    lock = threading.Lock()
+    state = {"current": 0, "peak": 0}
+
+    def task(_):
+        with lock:
+            state["current"] += 1
+            state["peak"] = max(state["peak"], state["current"])
+        time.sleep(0.01)
+        with lock:
+            state["current"] -= 1
+
+    executor_map(task, range(40), max_workers=4)
+    assert state["peak"] <= 4
+
+
+def test_executor_map_error_drain():
+    started = []
+    finished = []
+
+    def flaky(i):
+        started.append(i)
+        if i == 5:
+            raise ValueError(i)
+        time.sleep(0.01)
+        finished.append(i)
+        return i
+
+    with pytest.raises(ValueError):
+        executor_map(flaky, range(100), max_workers=2)
+    # Queued tasks were cancelled and in-flight ones drained before re-raising.
+    assert set(started) - set(finished) == {5}